@@ -1,3 +1,5 @@
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+
 import streamlit as st
 import matplotlib.pyplot as plt
 
@@ -11,7 +13,11 @@ from src.scorer import (
     compute_category_scores,
 )
 from src.semantic import semantic_skill_match, load_model
-from src.visualiser import generate_similarity_matrix, plot_heatmap
+from src.visualiser import (
+    PYPLOT_LOCK,
+    generate_similarity_matrix,
+    plot_heatmap,
+)
 
 
 # ==============================
@@ -38,11 +44,88 @@ st.markdown(
 )
 
 # ==============================
-# Cached Semantic Model
+# Background Semantic Worker
 # ==============================
+# Upper bound on waiting for the model or a semantic stage; covers a
+# cold hub download, after which the panel reports semantic as unavailable
+SEMANTIC_TIMEOUT_SECONDS = 120
+
+
 @st.cache_resource(show_spinner=False)
+def get_executor():
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="semantic")
+
+
+@st.cache_resource(show_spinner=False)
+def get_load_executor():
+    # Separate from the stage pool: stages block on the load, so sharing
+    # workers could leave a resubmitted load queued behind them forever
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="model-load")
+
+
+@st.cache_resource(show_spinner=False)
+def get_model_future():
+    """
+    Start loading the model in the background.
+    Cached, so the load is submitted once per process.
+    """
+    return get_load_executor().submit(load_model)
+
+
 def get_semantic_model():
-    return load_model()
+    try:
+        return get_model_future().result(timeout=SEMANTIC_TIMEOUT_SECONDS)
+    except TimeoutError:
+        # still loading; keep the in-flight future
+        raise
+    except Exception:
+        # Don't keep a failed load cached; the next call retries
+        get_model_future.clear()
+        raise
+
+
+def run_semantic_stage(resume_skills, jd_skills):
+    """
+    Semantic matching + heatmap.
+    Runs on the executor; returns plain results, no st.* calls.
+    """
+    model = get_semantic_model()
+
+    semantic_matched, semantic_score = semantic_skill_match(
+        model,
+        resume_skills,
+        jd_skills,
+    )
+
+    resume_flat = [
+        skill for skills in resume_skills.values() for skill in skills
+    ]
+
+    jd_flat = [
+        skill for skills in jd_skills.values() for skill in skills
+    ]
+
+    heatmap_fig = None
+
+    if resume_flat and jd_flat:
+        similarity_matrix = generate_similarity_matrix(
+            model,
+            resume_flat,
+            jd_flat,
+        )
+
+        if similarity_matrix is not None:
+            heatmap_fig = plot_heatmap(
+                similarity_matrix,
+                resume_flat,
+                jd_flat,
+            )
+
+    return semantic_matched, semantic_score, heatmap_fig
+
+
+# Warm the model as soon as the session starts
+get_model_future()
 
 
 # ==============================
@@ -64,6 +147,49 @@ center_col = st.columns([1, 2, 1])[1]
 analyze_clicked = center_col.button("Analyze Resume", use_container_width=True)
 
 
+# ==============================
+# Render Helpers
+# ==============================
+def render_scores(slots, structured_score, semantic_score):
+    final_score = compute_hybrid_score(structured_score, semantic_score)
+
+    slots["final"].metric("Final Match Score", f"{final_score:.2f}%")
+    slots["semantic"].metric("Related Skill Match", f"{semantic_score:.2f}%")
+    slots["progress"].progress(int(max(0, min(final_score, 100))))
+
+    slots["breakdown"].markdown(
+        f"""
+**Exact Skill Match:** {structured_score:.2f}%  
+
+**Related Skill Match:** {semantic_score:.2f}%  
+
+**Overall Fit Score:** {final_score:.2f}%  
+"""
+    )
+
+    if final_score >= 75:
+        slots["verdict"].success("The resume is a strong fit for this role.")
+    elif final_score >= 50:
+        slots["verdict"].warning(
+            "The resume matches many requirements, but some gaps remain."
+        )
+    else:
+        slots["verdict"].error(
+            "The resume needs more alignment with this job description."
+        )
+
+
+def render_matched(slot, matched):
+    with slot.container():
+        st.subheader("Matched Skills")
+
+        if matched:
+            for skill in matched:
+                st.markdown(f"- {skill.title()}")
+        else:
+            st.info("No matched skills found")
+
+
 # ==============================
 # Main Logic
 # ==============================
@@ -92,29 +218,6 @@ if analyze_clicked:
                 jd_skills,
             )
 
-            # Semantic Score
-            semantic_score = 0.0
-            semantic_matched = set()
-            model = None
-
-            if use_semantic:
-                model = get_semantic_model()
-                semantic_matched, semantic_score = semantic_skill_match(
-                    model,
-                    resume_skills,
-                    jd_skills,
-                )
-
-            # Hybrid Fusion
-            final_score = compute_hybrid_score(
-                structured_score,
-                semantic_score,
-            )
-
-            matched = sorted(
-                set(matched_structured).union(semantic_matched)
-            )
-
             severity = get_missing_skills_with_severity(
                 resume_skills,
                 jd_skills,
@@ -125,39 +228,44 @@ if analyze_clicked:
                 jd_skills,
             )
 
+        # Semantic stage runs in the background while
+        # the structured panels below are drawn
+        semantic_future = None
+
+        if use_semantic:
+            semantic_future = get_executor().submit(
+                run_semantic_stage,
+                resume_skills,
+                jd_skills,
+            )
+
         # ================= KPI =================
         k1, k2, k3 = st.columns(3)
 
-        with k1:
-            st.metric("Final Match Score", f"{final_score:.2f}%")
-
         with k2:
             st.metric("Exact Skill Match", f"{structured_score:.2f}%")
 
-        with k3:
-            st.metric("Related Skill Match", f"{semantic_score:.2f}%")
-
-        st.progress(int(max(0, min(final_score, 100))))
+        slots = {
+            "final": k1.empty(),
+            "semantic": k3.empty(),
+            "progress": st.empty(),
+        }
 
         # ================= MATCH BREAKDOWN =================
         st.markdown("### Match Breakdown For This Job")
 
-        st.markdown(
-            f"""
-**Exact Skill Match:** {structured_score:.2f}%  
-
-**Related Skill Match:** {semantic_score:.2f}%  
-
-**Overall Fit Score:** {final_score:.2f}%  
-"""
-        )
+        slots["breakdown"] = st.empty()
+        slots["verdict"] = st.empty()
 
-        if final_score >= 75:
-            st.success("The resume is a strong fit for this role.")
-        elif final_score >= 50:
-            st.warning("The resume matches many requirements, but some gaps remain.")
+        if semantic_future is not None:
+            slots["final"].metric("Final Match Score", "…")
+            slots["semantic"].metric("Related Skill Match", "…")
+            slots["breakdown"].markdown(
+                f"**Exact Skill Match:** {structured_score:.2f}%  \n\n"
+                "_Related skill match is still computing..._"
+            )
         else:
-            st.error("The resume needs more alignment with this job description.")
+            render_scores(slots, structured_score, 0.0)
 
         # ================= DASHBOARD =================
         st.subheader("Skill Analysis Dashboard")
@@ -176,63 +284,43 @@ if analyze_clicked:
                     sizes.append(val)
 
             if sizes:
-                fig, ax = plt.subplots(figsize=(3, 3))
-                fig.patch.set_facecolor("#0E1117")
-                ax.set_facecolor("#0E1117")
-
-                pie_output = ax.pie(
-                    sizes,
-                    labels=labels,
-                    autopct="%1.0f%%",
-                    startangle=90,
-                    wedgeprops=dict(linewidth=1, edgecolor="#111"),
-                )
+                with PYPLOT_LOCK:
+                    fig, ax = plt.subplots(figsize=(3, 3))
+                    fig.patch.set_facecolor("#0E1117")
+                    ax.set_facecolor("#0E1117")
+
+                    pie_output = ax.pie(
+                        sizes,
+                        labels=labels,
+                        autopct="%1.0f%%",
+                        startangle=90,
+                        wedgeprops=dict(linewidth=1, edgecolor="#111"),
+                    )
 
-                if len(pie_output) == 3:
-                    wedges, texts, autotexts = pie_output
-                else:
-                    wedges, texts = pie_output
-                    autotexts = []
+                    if len(pie_output) == 3:
+                        wedges, texts, autotexts = pie_output
+                    else:
+                        wedges, texts = pie_output
+                        autotexts = []
 
-                for text in texts:
-                    text.set_color("white")
-                    text.set_fontsize(8)
+                    for text in texts:
+                        text.set_color("white")
+                        text.set_fontsize(8)
 
-                for autotext in autotexts:
-                    autotext.set_color("white")
-                    autotext.set_fontsize(8)
-                    autotext.set_fontweight("bold")
+                    for autotext in autotexts:
+                        autotext.set_color("white")
+                        autotext.set_fontsize(8)
+                        autotext.set_fontweight("bold")
 
-                ax.axis("equal")
-                st.pyplot(fig, clear_figure=True)
+                    ax.axis("equal")
+                    st.pyplot(fig, clear_figure=True)
 
         # ---------- HEATMAP ----------
         with dashboard_col2:
+            heatmap_slot = st.empty()
 
-            if use_semantic and model is not None:
-
-                resume_flat = [
-                    skill for skills in resume_skills.values() for skill in skills
-                ]
-
-                jd_flat = [
-                    skill for skills in jd_skills.values() for skill in skills
-                ]
-
-                if resume_flat and jd_flat:
-                    similarity_matrix = generate_similarity_matrix(
-                        model,
-                        resume_flat,
-                        jd_flat,
-                    )
-
-                    if similarity_matrix is not None:
-                        fig = plot_heatmap(
-                            similarity_matrix,
-                            resume_flat,
-                            jd_flat,
-                        )
-                        st.pyplot(fig)
+            if semantic_future is not None:
+                heatmap_slot.info("Building semantic similarity heatmap...")
 
         # ================= RESULTS =================
         st.markdown("<br>", unsafe_allow_html=True)
@@ -240,13 +328,8 @@ if analyze_clicked:
         results_col1, results_col2 = st.columns(2)
 
         with results_col1:
-            st.subheader("Matched Skills")
-
-            if matched:
-                for skill in matched:
-                    st.markdown(f"- {skill.title()}")
-            else:
-                st.info("No matched skills found")
+            matched_slot = st.empty()
+            render_matched(matched_slot, sorted(set(matched_structured)))
 
         with results_col2:
             st.subheader("Skill Gap Analysis")
@@ -294,5 +377,28 @@ if analyze_clicked:
                         for s in skills:
                             st.markdown(f"- {s.title()}")
 
+        # ================= SEMANTIC (fills in) =================
+        if semantic_future is not None:
+            try:
+                semantic_matched, semantic_score, heatmap_fig = (
+                    semantic_future.result(timeout=SEMANTIC_TIMEOUT_SECONDS)
+                )
+            except Exception as e:
+                print("Semantic stage error:", e)
+                render_scores(slots, structured_score, 0.0)
+                heatmap_slot.warning("Semantic matching is unavailable.")
+            else:
+                render_scores(slots, structured_score, semantic_score)
+
+                render_matched(
+                    matched_slot,
+                    sorted(set(matched_structured).union(semantic_matched)),
+                )
+
+                if heatmap_fig is not None:
+                    heatmap_slot.pyplot(heatmap_fig)
+                else:
+                    heatmap_slot.empty()
+
     else:
         st.warning("Please upload resume and paste job description.")
\ No newline at end of file
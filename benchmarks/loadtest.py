@@ -0,0 +1,542 @@
+# benchmarks/loadtest.py
+"""
+Concurrent load test for the resume analysis path.
+
+Drives the same steps app_streamlit.py runs per click (save upload,
+extract, skills, structured + semantic scoring, pie and heatmap figures)
+either in-process or through a local HTTP stand-in, at one or more
+concurrency levels. Reports p50/p95/p99 latency, throughput, error rate
+and RSS over time, and saves everything as JSON for later comparison.
+
+Each score is checked against a serial baseline, so a request that
+silently scored someone else's upload counts as an error (WrongResult).
+
+Usage (from the repo root):
+    python -m benchmarks.loadtest --concurrency 1 4 8 --requests 40
+    python -m benchmarks.loadtest --mode http --semantic-ratio 0 --json run.json
+    python -m benchmarks.loadtest --compare before.json after.json
+"""
+
+import argparse
+import base64
+import io
+import json
+import math
+import os
+import random
+import resource
+import tempfile
+import threading
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Optional
+
+import matplotlib
+
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+from matplotlib.backends.backend_pdf import PdfPages
+from matplotlib.figure import Figure
+from docx import Document
+
+from src.extractor import extract_text
+from src.preprocess import preprocess_text
+from src.matcher import SKILL_DB, extract_skills
+from src.scorer import (
+    compute_structured_score,
+    compute_hybrid_score,
+    get_missing_skills_with_severity,
+    compute_category_scores,
+)
+from src.semantic import semantic_skill_match, load_model
+from src.visualiser import (
+    PYPLOT_LOCK,
+    generate_similarity_matrix,
+    plot_heatmap,
+)
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# The app writes every upload to this one name; the load test reproduces
+# that sharing inside a temp directory rather than over the tracked file
+APP_TEMP_NAME = "temp_resume"
+
+JD_TEXT = """
+Looking for ML engineer with Python, PyTorch, NLP and Docker experience.
+Familiarity with pandas, numpy, git and React is a plus.
+"""
+
+# Synthetic resume sizes: number of filler paragraphs
+RESUME_SIZES = {"small": 5, "medium": 50, "large": 400}
+
+# The app only accepts PDF uploads, so the mix is weighted toward them
+FORMAT_WEIGHTS = {".pdf": 3, ".docx": 1}
+
+PDF_LINES_PER_PAGE = 45
+
+_model = None
+_model_lock = threading.Lock()
+
+
+def get_semantic_model():
+    """
+    Process-global model, shared like st.cache_resource shares it.
+    """
+    global _model
+
+    with _model_lock:
+        if _model is None:
+            _model = load_model()
+
+    return _model
+
+
+# ==============================
+# Workload
+# ==============================
+def _resume_lines(rng: random.Random, paragraphs: int):
+    all_skills = [skill for skills in SKILL_DB.values() for skill in skills]
+
+    for i in range(paragraphs):
+        skills = ", ".join(rng.sample(all_skills, 4))
+        yield (
+            f"Project {i}: built and shipped production systems using "
+            f"{skills}. Worked with cross-functional teams on delivery."
+        )
+
+
+def _write_pdf(path: Path, lines) -> None:
+    """
+    Text-only PDF via matplotlib, with TrueType fonts so pdfplumber
+    extracts it like a real resume.
+    """
+    lines = ["Candidate Resume"] + list(lines)
+
+    with matplotlib.rc_context({"pdf.fonttype": 42}), PdfPages(path) as pdf:
+        for start in range(0, len(lines), PDF_LINES_PER_PAGE):
+            fig = Figure(figsize=(8.5, 11))
+
+            for row, line in enumerate(lines[start:start + PDF_LINES_PER_PAGE]):
+                fig.text(0.05, 0.96 - row * 0.021, line, fontsize=7)
+
+            pdf.savefig(fig)
+
+
+def build_resumes(out_dir: Path) -> dict:
+    """
+    PDF and DOCX resumes of several sizes plus the bundled sample PDF.
+    Returns {name: (suffix, bytes)}.
+    """
+    rng = random.Random(0)
+    resumes = {}
+
+    for name, paragraphs in RESUME_SIZES.items():
+        pdf_path = out_dir / f"{name}.pdf"
+        _write_pdf(pdf_path, _resume_lines(rng, paragraphs))
+        resumes[f"pdf_{name}"] = (".pdf", pdf_path.read_bytes())
+
+        doc = Document()
+        doc.add_heading("Candidate Resume", level=1)
+
+        for line in _resume_lines(rng, paragraphs):
+            doc.add_paragraph(line)
+
+        docx_path = out_dir / f"{name}.docx"
+        doc.save(str(docx_path))
+        resumes[f"docx_{name}"] = (".docx", docx_path.read_bytes())
+
+    sample_pdf = ROOT / "test_data" / "resume.pdf"
+    if sample_pdf.exists():
+        resumes["sample_pdf"] = (".pdf", sample_pdf.read_bytes())
+
+    return resumes
+
+
+def analyze(
+    resume_bytes: bytes,
+    suffix: str,
+    jd_text: str,
+    use_semantic: bool,
+    shared_dir: Optional[Path] = None,
+) -> float:
+    """
+    One "Analyze Resume" click, minus the Streamlit rendering.
+    Returns the final score.
+
+    With shared_dir, every call writes the same file in it, as the app
+    does; otherwise each call gets its own temp file.
+    """
+    shared_temp = shared_dir is not None
+
+    if shared_temp:
+        temp_path = shared_dir / (APP_TEMP_NAME + suffix)
+    else:
+        fd, name = tempfile.mkstemp(suffix=suffix)
+        os.close(fd)
+        temp_path = Path(name)
+
+    try:
+        with open(temp_path, "wb") as f:
+            f.write(resume_bytes)
+
+        raw_text = extract_text(str(temp_path))
+    finally:
+        if not shared_temp:
+            temp_path.unlink(missing_ok=True)
+
+    clean_text = preprocess_text(raw_text)
+    resume_skills = extract_skills(clean_text)
+
+    jd_skills = extract_skills(preprocess_text(jd_text))
+
+    structured_score, _ = compute_structured_score(resume_skills, jd_skills)
+    get_missing_skills_with_severity(resume_skills, jd_skills)
+    category_scores = compute_category_scores(resume_skills, jd_skills)
+
+    # Figures are rendered like st.pyplot (savefig) and never closed,
+    # matching the app, so pyplot's per-click figure growth shows in RSS:
+    # the pie is cleared (clear_figure=True), the heatmap is left as is
+    sizes = [val for val in category_scores.values() if val > 0]
+    if sizes:
+        with PYPLOT_LOCK:
+            fig, ax = plt.subplots(figsize=(3, 3))
+            ax.pie(sizes, autopct="%1.0f%%", startangle=90)
+            fig.savefig(io.BytesIO(), format="png")
+            fig.clf()
+
+    semantic_score = 0.0
+
+    if use_semantic:
+        model = get_semantic_model()
+        _, semantic_score = semantic_skill_match(model, resume_skills, jd_skills)
+
+        resume_flat = [s for skills in resume_skills.values() for s in skills]
+        jd_flat = [s for skills in jd_skills.values() for s in skills]
+
+        matrix = generate_similarity_matrix(model, resume_flat, jd_flat)
+        fig = plot_heatmap(matrix, resume_flat, jd_flat)
+
+        if fig is not None:
+            with PYPLOT_LOCK:
+                fig.savefig(io.BytesIO(), format="png")
+
+    return compute_hybrid_score(structured_score, semantic_score)
+
+
+# ==============================
+# HTTP stand-in
+# ==============================
+class AnalyzeHandler(BaseHTTPRequestHandler):
+
+    shared_dir = None
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        payload = json.loads(body)
+
+        try:
+            score = analyze(
+                base64.b64decode(payload["resume"]),
+                payload["suffix"],
+                payload["jd_text"],
+                payload["semantic"],
+                self.shared_dir,
+            )
+            status, response = 200, {"final_score": score}
+        except Exception as e:
+            status, response = 500, {"error": str(e)}
+
+        data = json.dumps(response).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_server(shared_dir: Optional[Path]) -> ThreadingHTTPServer:
+    handler = type("Handler", (AnalyzeHandler,), {"shared_dir": shared_dir})
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def http_call(url: str, resume_bytes, suffix, jd_text, use_semantic) -> float:
+    payload = json.dumps(
+        {
+            "resume": base64.b64encode(resume_bytes).decode(),
+            "suffix": suffix,
+            "jd_text": jd_text,
+            "semantic": use_semantic,
+        }
+    ).encode()
+
+    request = urllib.request.Request(
+        url,
+        data=payload,
+        headers={"Content-Type": "application/json"},
+    )
+
+    with urllib.request.urlopen(request, timeout=300) as response:
+        return json.loads(response.read())["final_score"]
+
+
+# ==============================
+# Measurement
+# ==============================
+def current_rss_mb() -> float:
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except OSError:
+        # no /proc (macOS): fall back to peak RSS, reported in bytes there
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 2**20
+
+
+class RssSampler:
+
+    def __init__(self, interval: float = 0.5):
+        self.interval = interval
+        self.samples = []
+        self._stop = threading.Event()
+        self._start = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.is_set():
+            elapsed = time.perf_counter() - self._start
+            self.samples.append([round(elapsed, 2), round(current_rss_mb(), 1)])
+            self._stop.wait(self.interval)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+
+def percentile(values, pct: float) -> float:
+    """
+    Nearest-rank percentile.
+    """
+    if not values:
+        return 0.0
+
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def run_level(
+    concurrency: int,
+    n_requests: int,
+    resumes: dict,
+    semantic_ratio: float,
+    call,
+    expected: dict,
+    seed: int = 0,
+) -> dict:
+
+    rng = random.Random(seed)
+    names = list(resumes)
+    weights = [FORMAT_WEIGHTS.get(resumes[name][0], 1) for name in names]
+
+    plan = [
+        (rng.choices(names, weights)[0], rng.random() < semantic_ratio)
+        for _ in range(n_requests)
+    ]
+
+    records = []
+    records_lock = threading.Lock()
+
+    def one(job):
+        name, use_semantic = job
+        suffix, data = resumes[name]
+        start = time.perf_counter()
+        error = None
+
+        try:
+            score = call(data, suffix, JD_TEXT, use_semantic)
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        else:
+            # e.g. another request overwrote the shared temp upload
+            if score != expected[(name, use_semantic)]:
+                error = "WrongResult"
+
+        latency = time.perf_counter() - start
+
+        with records_lock:
+            records.append(
+                {
+                    "resume": name,
+                    "semantic": use_semantic,
+                    "latency_s": latency,
+                    "error": error,
+                }
+            )
+
+    with RssSampler() as sampler:
+        wall_start = time.perf_counter()
+
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            list(pool.map(one, plan))
+
+        wall = time.perf_counter() - wall_start
+
+    ok_latencies = [r["latency_s"] for r in records if r["error"] is None]
+    errors = [r for r in records if r["error"] is not None]
+
+    return {
+        "concurrency": concurrency,
+        "requests": n_requests,
+        "wall_s": wall,
+        "throughput_rps": len(ok_latencies) / wall if wall else 0.0,
+        "error_rate": len(errors) / n_requests if n_requests else 0.0,
+        "p50_s": percentile(ok_latencies, 50),
+        "p95_s": percentile(ok_latencies, 95),
+        "p99_s": percentile(ok_latencies, 99),
+        "peak_rss_mb": max((s[1] for s in sampler.samples), default=0.0),
+        "rss_mb": sampler.samples,
+        "sample_errors": sorted({r["error"] for r in errors})[:5],
+        "records": records,
+    }
+
+
+# ==============================
+# Reporting
+# ==============================
+SUMMARY_KEYS = ["p50_s", "p95_s", "p99_s", "throughput_rps", "error_rate", "peak_rss_mb"]
+
+
+def print_level(level: dict) -> None:
+    print(
+        f"c={level['concurrency']:<3} "
+        f"p50={level['p50_s']:.3f}s p95={level['p95_s']:.3f}s "
+        f"p99={level['p99_s']:.3f}s "
+        f"rps={level['throughput_rps']:.2f} "
+        f"err={level['error_rate'] * 100:.1f}% "
+        f"rss={level['peak_rss_mb']:.0f}MB"
+    )
+
+    for error in level["sample_errors"]:
+        print(f"      {error}")
+
+
+def compare(before_path: str, after_path: str) -> None:
+    with open(before_path) as f:
+        before = {lvl["concurrency"]: lvl for lvl in json.load(f)["levels"]}
+    with open(after_path) as f:
+        after = {lvl["concurrency"]: lvl for lvl in json.load(f)["levels"]}
+
+    for concurrency in sorted(set(before) & set(after)):
+        print(f"\nconcurrency={concurrency}")
+        for key in SUMMARY_KEYS:
+            b, a = before[concurrency][key], after[concurrency][key]
+            delta = ((a - b) / b * 100) if b else 0.0
+            print(f"  {key:<15} {b:>10.3f} -> {a:>10.3f}  ({delta:+.1f}%)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Resume analysis load test")
+    parser.add_argument("--mode", choices=["inprocess", "http"], default="inprocess")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--requests", type=int, default=32, help="requests per level")
+    parser.add_argument(
+        "--semantic-ratio",
+        type=float,
+        default=0.5,
+        help="fraction of requests with semantic matching enabled",
+    )
+    parser.add_argument(
+        "--private-temp",
+        action="store_true",
+        help="use a unique temp file per request instead of the app's shared one",
+    )
+    parser.add_argument("--json", help="write results to this file")
+    parser.add_argument("--compare", nargs=2, metavar=("BEFORE", "AFTER"))
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    shared_temp = not args.private_temp
+
+    with tempfile.TemporaryDirectory() as tmp:
+        resumes = build_resumes(Path(tmp))
+        shared_dir = Path(tmp) if shared_temp else None
+
+        # load outside the timed runs, as the cached app model would be
+        if args.semantic_ratio > 0:
+            get_semantic_model()
+
+        server = None
+
+        if args.mode == "http":
+            server = start_server(shared_dir)
+            url = f"http://127.0.0.1:{server.server_port}/analyze"
+
+            def call(data, suffix, jd_text, use_semantic):
+                return http_call(url, data, suffix, jd_text, use_semantic)
+        else:
+            def call(data, suffix, jd_text, use_semantic):
+                return analyze(data, suffix, jd_text, use_semantic, shared_dir)
+
+        # serial, private-file baseline every concurrent result must match
+        expected = {
+            (name, use_semantic): analyze(data, suffix, JD_TEXT, use_semantic)
+            for name, (suffix, data) in resumes.items()
+            for use_semantic in (False, True)
+            if not use_semantic or args.semantic_ratio > 0
+        }
+
+        levels = []
+
+        try:
+            for concurrency in args.concurrency:
+                level = run_level(
+                    concurrency,
+                    args.requests,
+                    resumes,
+                    args.semantic_ratio,
+                    call,
+                    expected,
+                )
+                levels.append(level)
+                print_level(level)
+        finally:
+            if server is not None:
+                server.shutdown()
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(
+                {
+                    "config": {
+                        "mode": args.mode,
+                        "requests": args.requests,
+                        "semantic_ratio": args.semantic_ratio,
+                        "shared_temp": shared_temp,
+                        "resumes": {k: len(v[1]) for k, v in resumes.items()},
+                        "cpu_count": os.cpu_count(),
+                        "timestamp": time.time(),
+                    },
+                    "levels": levels,
+                },
+                f,
+                indent=2,
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+# benchmarks/startup.py
+"""
+Time-to-first-score from process start.
+
+Each run spawns a fresh interpreter that imports the pipeline, loads the
+model and scores one resume/JD pair. The parent measures wall time from
+spawn to the first score; the child reports its own stage timings.
+
+Usage (from the repo root):
+    python -m benchmarks.startup --runs 5
+    python -m benchmarks.startup --modes hub snapshot --json startup.json
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+CHILD_CODE = r"""
+import json, sys, time
+t0 = time.perf_counter()
+
+from src.matcher import extract_skills
+from src.scorer import compute_structured_score, compute_hybrid_score
+from src.semantic import load_model, semantic_skill_match, SNAPSHOT_DIR
+t_import = time.perf_counter()
+
+mode = sys.argv[1]
+model = load_model(snapshot_dir=None if mode == "hub" else SNAPSHOT_DIR)
+t_load = time.perf_counter()
+
+resume_skills = extract_skills("python pytorch nlp docker git pandas react")
+jd_skills = extract_skills("ML engineer with JS, CSS3, tensorflow and linux")
+structured, _ = compute_structured_score(resume_skills, jd_skills)
+_, semantic = semantic_skill_match(model, resume_skills, jd_skills)
+score = compute_hybrid_score(structured, semantic)
+t_score = time.perf_counter()
+first_score_at = time.time()
+
+print(json.dumps({
+    "import_s": t_import - t0,
+    "load_s": t_load - t_import,
+    "first_score_s": t_score - t_load,
+    "score": score,
+    "first_score_at": first_score_at,
+}), flush=True)
+"""
+
+
+def run_once(mode: str) -> dict:
+    # wall clock, to compare against the child's absolute timestamp;
+    # the child's interpreter teardown happens after and is excluded
+    spawn_at = time.time()
+
+    proc = subprocess.run(
+        [sys.executable, "-c", CHILD_CODE, mode],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    # last stdout line is the child's report; anything before is logging
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    result["time_to_first_score_s"] = result.pop("first_score_at") - spawn_at
+
+    return result
+
+
+def summarise(runs):
+    keys = ["time_to_first_score_s", "import_s", "load_s", "first_score_s"]
+
+    return {
+        key: {
+            "median": statistics.median(r[key] for r in runs),
+            "min": min(r[key] for r in runs),
+            "max": max(r[key] for r in runs),
+        }
+        for key in keys
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument(
+        "--modes",
+        nargs="+",
+        choices=["hub", "snapshot"],
+        default=["hub", "snapshot"],
+    )
+    parser.add_argument("--json", help="write results to this file")
+    args = parser.parse_args()
+
+    # the deploy-time prepare step, so the snapshot exists before it is measured
+    if "snapshot" in args.modes:
+        subprocess.run(
+            [sys.executable, "-m", "src.semantic", "--save-snapshot"],
+            cwd=ROOT,
+            check=True,
+        )
+
+    results = {}
+
+    for mode in args.modes:
+        runs = [run_once(mode) for _ in range(args.runs)]
+        results[mode] = {"runs": runs, "summary": summarise(runs)}
+
+        summary = results[mode]["summary"]
+        print(f"\n[{mode}] {args.runs} runs")
+        for key, stats in summary.items():
+            print(
+                f"  {key:<24} median {stats['median']:.2f}s  "
+                f"(min {stats['min']:.2f}s, max {stats['max']:.2f}s)"
+            )
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
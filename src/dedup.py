@@ -0,0 +1,244 @@
+# src/dedup.py
+"""
+Near-duplicate resume detection.
+
+Resumes are reduced to MinHash signatures over word shingles of their
+normalized text and bucketed with LSH banding. Each new document is only
+compared against group representatives that share a band with it, so
+cost stays roughly linear in pool size instead of pairwise.
+
+Usage:
+    index = DedupIndex(threshold=0.9)
+    rep = index.add("a.pdf", text)   # returns "a.pdf" if it is new,
+                                     # otherwise the representative's id
+"""
+
+import hashlib
+from collections import defaultdict
+from typing import Dict, Hashable, List, Optional, Tuple
+
+import numpy as np
+
+from src.matcher import normalize_text
+
+# Largest prime below 2**32: a * h + b stays inside uint64 for h < 2**32
+_PRIME = np.uint64(4294967291)
+
+DEFAULT_THRESHOLD = 0.9
+DEFAULT_NUM_PERM = 128
+DEFAULT_SHINGLE_SIZE = 5
+
+# Upper bound on representatives verified per document, so boilerplate
+# that lands many documents in one bucket cannot go quadratic
+MAX_CANDIDATES = 32
+
+
+# ==============================
+# Signatures
+# ==============================
+def shingles(text: str, size: int = DEFAULT_SHINGLE_SIZE) -> List[str]:
+    words = normalize_text(text).split()
+
+    if len(words) <= size:
+        return [" ".join(words)]
+
+    return [" ".join(words[i:i + size]) for i in range(len(words) - size + 1)]
+
+
+def _hash32(value: str) -> int:
+    digest = hashlib.blake2b(value.encode("utf-8"), digest_size=4).digest()
+    return int.from_bytes(digest, "little")
+
+
+def choose_bands(threshold: float, num_perm: int) -> Tuple[int, int]:
+    """
+    Pick (bands, rows) with bands * rows == num_perm whose LSH
+    S-curve midpoint (1 / bands) ** (1 / rows) sits closest to the
+    threshold without exceeding it, favouring recall.
+    """
+    best = (num_perm, 1)
+    best_gap = float("inf")
+
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows:
+            continue
+
+        bands = num_perm // rows
+        midpoint = (1 / bands) ** (1 / rows)
+        gap = threshold - midpoint
+
+        if 0 <= gap < best_gap:
+            best, best_gap = (bands, rows), gap
+
+    return best
+
+
+class MinHasher:
+    """
+    Universal-hash MinHash: h_i(x) = (a_i * x + b_i) mod p.
+    """
+
+    def __init__(self, num_perm: int = DEFAULT_NUM_PERM, seed: int = 1):
+        rng = np.random.RandomState(seed)
+        self.num_perm = num_perm
+        self.a = rng.randint(1, 2**32 - 5, size=num_perm, dtype=np.uint64)
+        self.b = rng.randint(0, 2**32 - 5, size=num_perm, dtype=np.uint64)
+
+    def signature(self, shingle_list: List[str]) -> np.ndarray:
+        hashes = np.fromiter(
+            (_hash32(s) for s in set(shingle_list)),
+            dtype=np.uint64,
+        )
+
+        # (num_perm, n_shingles), reduced to the min per permutation
+        permuted = (np.outer(self.a, hashes) + self.b[:, None]) % _PRIME
+
+        return permuted.min(axis=1).astype(np.uint32)
+
+
+def estimate_jaccard(sig_a: np.ndarray, sig_b: np.ndarray) -> float:
+    return float(np.mean(sig_a == sig_b))
+
+
+# ==============================
+# LSH index
+# ==============================
+class DedupIndex:
+    """
+    Streaming near-duplicate grouping.
+
+    Only representatives are stored in the LSH buckets; a document joins
+    the first representative whose estimated Jaccard similarity is at
+    least the threshold, otherwise it becomes a new representative.
+    Identical normalized text is matched by hash without MinHash.
+    """
+
+    def __init__(
+        self,
+        threshold: float = DEFAULT_THRESHOLD,
+        num_perm: int = DEFAULT_NUM_PERM,
+        shingle_size: int = DEFAULT_SHINGLE_SIZE,
+        seed: int = 1,
+    ):
+        self.threshold = threshold
+        self.shingle_size = shingle_size
+        self.hasher = MinHasher(num_perm, seed)
+        self.bands, self.rows = choose_bands(threshold, num_perm)
+
+        self._exact: Dict[str, Hashable] = {}
+        self._signatures: Dict[Hashable, np.ndarray] = {}
+        self._buckets = [defaultdict(list) for _ in range(self.bands)]
+        self.groups: Dict[Hashable, List[Hashable]] = {}
+
+    def _band_keys(self, signature: np.ndarray):
+        for band in range(self.bands):
+            start = band * self.rows
+            yield band, signature[start:start + self.rows].tobytes()
+
+    def _normalized(self, text: str) -> str:
+        return " ".join(normalize_text(text).split())
+
+    def _exact_key(self, normalized: str) -> str:
+        return hashlib.sha1(normalized.encode("utf-8")).hexdigest()
+
+    def _minhash(self, text: str):
+        signature = self.hasher.signature(shingles(text, self.shingle_size))
+        return signature, list(self._band_keys(signature))
+
+    def _match(self, signature: np.ndarray, band_keys) -> Optional[Hashable]:
+        candidates = []
+        seen = set()
+
+        for band, key in band_keys:
+            for rep in self._buckets[band].get(key, ()):
+                if rep not in seen:
+                    seen.add(rep)
+                    candidates.append(rep)
+
+            if len(candidates) >= MAX_CANDIDATES:
+                break
+
+        for rep in candidates[:MAX_CANDIDATES]:
+            similarity = estimate_jaccard(signature, self._signatures[rep])
+
+            if similarity >= self.threshold:
+                return rep
+
+        return None
+
+    def find_exact(self, text: str) -> Optional[Hashable]:
+        """
+        Representative with identical normalized text, or None.
+        """
+        normalized = self._normalized(text)
+
+        if not normalized:
+            return None
+
+        return self._exact.get(self._exact_key(normalized))
+
+    def find(self, text: str) -> Optional[Hashable]:
+        """
+        Representative this text would join, or None. Does not index it.
+        Empty text (e.g. image-only PDFs) never matches anything.
+        """
+        normalized = self._normalized(text)
+
+        if not normalized:
+            return None
+
+        exact_key = self._exact_key(normalized)
+
+        if exact_key in self._exact:
+            return self._exact[exact_key]
+
+        return self._match(*self._minhash(text))
+
+    def add(self, doc_id: Hashable, text: str, new_group: bool = False) -> Hashable:
+        """
+        Index one document. Returns the id of its group representative,
+        which is doc_id itself when the document is not a duplicate.
+        new_group=True makes it a representative without matching.
+
+        Documents with empty normalized text carry no signal, so each is
+        its own group and is never indexed for matching.
+        """
+        normalized = self._normalized(text)
+
+        if not normalized:
+            self.groups[doc_id] = [doc_id]
+            return doc_id
+
+        exact_key = self._exact_key(normalized)
+        rep = None if new_group else self._exact.get(exact_key)
+
+        if rep is not None:
+            self.groups[rep].append(doc_id)
+            return rep
+
+        signature, band_keys = self._minhash(text)
+        rep = None if new_group else self._match(signature, band_keys)
+
+        if rep is not None:
+            self._exact[exact_key] = rep
+            self.groups[rep].append(doc_id)
+            return rep
+
+        # New representative
+        self._exact[exact_key] = doc_id
+        self._signatures[doc_id] = signature
+        self.groups[doc_id] = [doc_id]
+
+        for band, key in band_keys:
+            self._buckets[band][key].append(doc_id)
+
+        return doc_id
+
+    def stats(self) -> dict:
+        total = sum(len(members) for members in self.groups.values())
+
+        return {
+            "documents": total,
+            "representatives": len(self.groups),
+            "duplicates_skipped": total - len(self.groups),
+        }
@@ -0,0 +1,578 @@
+# src/ingest.py
+"""
+Watch-folder ingestion.
+
+Polls a directory for new or changed resumes, scores only those against
+every active JD and appends the results to a JSONL file. Processed-file
+state is checkpointed so a restart resumes without reprocessing.
+
+Usage (from the repo root):
+    python -m src.ingest --watch inbox --jd-dir jds --out results.jsonl
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import time
+from collections import deque
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from src.extractor import extract_text
+from src.preprocess import preprocess_text
+from src.matcher import extract_skills
+from src.scorer import compute_structured_score, compute_hybrid_score
+from src.dedup import DEFAULT_THRESHOLD, DedupIndex
+
+SUPPORTED_SUFFIXES = {".pdf", ".docx"}
+
+# Files modified more recently than this are assumed to still be copying
+SETTLE_SECONDS = 2.0
+
+
+# ==============================
+# Active job descriptions
+# ==============================
+def load_jds(jd_dir: str) -> Tuple[Dict[str, Dict[str, List[str]]], Dict[str, str]]:
+    """
+    Load every .txt file in jd_dir as an active JD, keyed by file stem.
+    Returns (skills per JD, content sha256 per JD); the hashes are
+    checkpointed so files are re-scored when a JD is added or edited.
+    """
+    jds = {}
+    fingerprints = {}
+
+    for path in sorted(Path(jd_dir).glob("*.txt")):
+        jd_text = path.read_text(encoding="utf-8")
+        jds[path.stem] = extract_skills(preprocess_text(jd_text))
+        fingerprints[path.stem] = hashlib.sha256(jd_text.encode("utf-8")).hexdigest()
+
+    if not jds:
+        raise ValueError(f"No job descriptions (*.txt) found in: {jd_dir}")
+
+    return jds, fingerprints
+
+
+# ==============================
+# Checkpointed state
+# ==============================
+# The checkpoint is an append-only log: one JSON line per processed file,
+# keyed by file name, later lines winning. It is compacted on load.
+def load_state(state_path: str) -> Dict[str, dict]:
+    path = Path(state_path)
+
+    if not path.exists():
+        return {}
+
+    state = {}
+
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # torn final line from a crash mid-append
+                continue
+
+            state[record.pop("name")] = record
+
+    compact_state(state, state_path)
+
+    return state
+
+
+def compact_state(state: Dict[str, dict], state_path: str) -> None:
+    # write-then-rename so a crash never leaves a half-written checkpoint
+    tmp_path = state_path + ".tmp"
+
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        for name, record in state.items():
+            f.write(json.dumps({"name": name, **record}) + "\n")
+
+        f.flush()
+        os.fsync(f.fileno())
+
+    os.replace(tmp_path, state_path)
+
+
+def append_state(log, name: str, record: dict) -> None:
+    log.write(json.dumps({"name": name, **record}) + "\n")
+    log.flush()
+    os.fsync(log.fileno())
+
+
+def file_hash(path: Path) -> str:
+    digest = hashlib.sha256()
+
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+# ==============================
+# Change detection
+# ==============================
+def _missing_jds(known: dict, jd_fingerprints: Dict[str, str]) -> List[str]:
+    scored = known.get("jds", {})
+    return [name for name, fp in jd_fingerprints.items() if scored.get(name) != fp]
+
+
+def scan_changes(
+    watch_dir: str,
+    state: Dict[str, dict],
+    jd_fingerprints: Dict[str, str],
+) -> List[dict]:
+    """
+    Return entries for files that are new, whose content changed, or
+    that have not been scored against every active JD.
+
+    mtime/size is checked first; the file is only hashed when that
+    differs, so unchanged files cost a single stat per poll.
+    A touched-but-identical file just has its mtime refreshed in state.
+    Files that vanish or cannot be read mid-scan are retried next poll.
+
+    Each entry's "jds" lists the JD names to score; "rescore" marks an
+    unchanged file that only needs the JDs it is missing.
+    """
+    now = time.time()
+    changes = []
+
+    for path in sorted(Path(watch_dir).iterdir()):
+
+        if path.suffix.lower() not in SUPPORTED_SUFFIXES:
+            continue
+
+        try:
+            if not path.is_file():
+                continue
+
+            stat = path.stat()
+
+            if now - stat.st_mtime < SETTLE_SECONDS:
+                continue
+
+            known = state.get(path.name)
+
+            if (
+                known
+                and known["mtime_ns"] == stat.st_mtime_ns
+                and known["size"] == stat.st_size
+            ):
+                digest = known["sha256"]
+            else:
+                digest = file_hash(path)
+
+        except OSError as e:
+            print("Scan error:", path, e)
+            continue
+
+        entry = {
+            "path": path,
+            "mtime": stat.st_mtime,
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "sha256": digest,
+            "jds": list(jd_fingerprints),
+            "rescore": False,
+        }
+
+        if known and known["sha256"] == digest:
+            known["mtime_ns"] = stat.st_mtime_ns
+            known["size"] = stat.st_size
+
+            missing = _missing_jds(known, jd_fingerprints)
+
+            if not missing:
+                continue
+
+            # lag for a JD re-score counts from when it was queued
+            entry.update(mtime=now, jds=missing, rescore=True)
+
+        changes.append(entry)
+
+    return changes
+
+
+# ==============================
+# Scoring
+# ==============================
+def score_resume(
+    path: Path,
+    jds: Dict[str, Dict[str, List[str]]],
+    model=None,
+) -> List[dict]:
+    """
+    extract_text -> extract_skills -> score against every active JD.
+    Semantic scoring is only used when a model is given.
+    """
+    return score_text(extract_text(str(path)), jds, model)
+
+
+def score_text(
+    raw_text: str,
+    jds: Dict[str, Dict[str, List[str]]],
+    model=None,
+) -> List[dict]:
+    return score_skills(extract_skills(preprocess_text(raw_text)), jds, model)
+
+
+def score_skills(
+    resume_skills: Dict[str, List[str]],
+    jds: Dict[str, Dict[str, List[str]]],
+    model=None,
+) -> List[dict]:
+    if model is not None:
+        from src.semantic import semantic_skill_match
+
+    results = []
+
+    for jd_name, jd_skills in jds.items():
+
+        structured_score, matched = compute_structured_score(
+            resume_skills,
+            jd_skills,
+        )
+
+        semantic_score = 0.0
+
+        if model is not None:
+            semantic_matched, semantic_score = semantic_skill_match(
+                model,
+                resume_skills,
+                jd_skills,
+            )
+            matched = sorted(set(matched).union(semantic_matched))
+
+        results.append(
+            {
+                "jd": jd_name,
+                "structured_score": structured_score,
+                "semantic_score": semantic_score,
+                "final_score": compute_hybrid_score(
+                    structured_score,
+                    semantic_score,
+                ),
+                "matched_skills": matched,
+            }
+        )
+
+    return results
+
+
+# ==============================
+# Duplicate reuse
+# ==============================
+class DedupState:
+    """
+    Reuses a representative's results for exact and near-duplicate
+    resumes. Identical files skip extraction entirely, identical
+    normalized text skips scoring. Near-duplicates still have their own
+    skills extracted and reuse results only when those skills match the
+    representative's exactly; a small edit that adds a skill is scored.
+    Kept in memory only.
+
+    Representatives are keyed by content sha256, and only registered
+    once their scoring has succeeded.
+    """
+
+    def __init__(self, threshold: float = DEFAULT_THRESHOLD):
+        self.threshold = threshold
+        self.duplicates = 0
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Drop cached groups and results, e.g. when the JD set changes.
+        """
+        self.index = DedupIndex(self.threshold)
+        self.by_sha256: Dict[str, str] = {}
+        self.results: Dict[str, List[dict]] = {}
+        self.rep_skills: Dict[str, Dict[str, List[str]]] = {}
+        self.rep_names: Dict[str, str] = {}
+
+    def score(self, entry: dict, jds, model=None) -> Tuple[List[dict], Optional[str]]:
+        """
+        Returns (results, representative file name or None).
+        """
+        path = entry["path"]
+        sha256 = entry["sha256"]
+        rep = self.by_sha256.get(sha256)
+
+        if rep is None:
+            raw_text = extract_text(str(path))
+            resume_skills = None
+            rep = self.index.find_exact(raw_text)
+
+            if rep is None:
+                rep = self.index.find(raw_text)
+                resume_skills = extract_skills(preprocess_text(raw_text))
+
+                # near-duplicate text is only reusable with identical skills
+                if rep is not None and self.rep_skills.get(rep) != resume_skills:
+                    rep = None
+
+            if rep is None or rep not in self.results:
+                if resume_skills is None:
+                    resume_skills = extract_skills(preprocess_text(raw_text))
+
+                self.results[sha256] = score_skills(resume_skills, jds, model)
+                self.rep_skills[sha256] = resume_skills
+                self.rep_names[sha256] = path.name
+                self.index.add(sha256, raw_text, new_group=True)
+                rep = sha256
+            else:
+                self.index.add(sha256, raw_text)
+
+            self.by_sha256[sha256] = rep
+
+        if rep == sha256 and self.rep_names[rep] == path.name:
+            return self.results[rep], None
+
+        self.duplicates += 1
+        return self.results[rep], self.rep_names[rep]
+
+
+# ==============================
+# Metrics
+# ==============================
+class IngestStats:
+    """
+    Rolling throughput, queue depth and lag for the ingestion loop.
+    """
+
+    def __init__(self, window_seconds: float = 60.0):
+        self.window_seconds = window_seconds
+        self.completed = deque()
+        self.total_processed = 0
+        self.total_errors = 0
+        self.queue_depth = 0
+        self.last_lag = 0.0
+
+    def record(self, lag: float, ok: bool = True) -> None:
+        now = time.time()
+        self.completed.append(now)
+        self.last_lag = lag
+
+        if ok:
+            self.total_processed += 1
+        else:
+            self.total_errors += 1
+
+        self._trim(now)
+
+    def throughput(self) -> float:
+        now = time.time()
+        self._trim(now)
+        return len(self.completed) / self.window_seconds
+
+    def _trim(self, now: float) -> None:
+        while self.completed and now - self.completed[0] > self.window_seconds:
+            self.completed.popleft()
+
+    def report(self) -> str:
+        return (
+            f"processed={self.total_processed} errors={self.total_errors} "
+            f"queue={self.queue_depth} "
+            f"throughput={self.throughput() * 60:.1f}/min "
+            f"lag={self.last_lag:.1f}s"
+        )
+
+
+# ==============================
+# Main loop
+# ==============================
+def run_once(
+    watch_dir: str,
+    jds: Dict[str, Dict[str, List[str]]],
+    jd_fingerprints: Dict[str, str],
+    out_path: str,
+    state: Dict[str, dict],
+    state_path: str,
+    stats: IngestStats,
+    model=None,
+    dedup: Optional[DedupState] = None,
+) -> int:
+    """
+    One poll cycle. Returns the number of files processed.
+
+    Results are appended and fsynced before the file is checkpointed,
+    so a crash can at worst re-emit the file being processed.
+    """
+    queue = deque(scan_changes(watch_dir, state, jd_fingerprints))
+    stats.queue_depth = len(queue)
+    processed = 0
+
+    with open(out_path, "a", encoding="utf-8") as out, \
+            open(state_path, "a", encoding="utf-8") as state_log:
+
+        while queue:
+            entry = queue.popleft()
+            stats.queue_depth = len(queue)
+            path = entry["path"]
+
+            duplicate_of = None
+            entry_jds = {name: jds[name] for name in entry["jds"]}
+
+            try:
+                # dedup caches results for the full JD set, so partial
+                # re-scores go straight to scoring
+                if dedup is not None and not entry["rescore"]:
+                    results, duplicate_of = dedup.score(entry, entry_jds, model)
+                else:
+                    results = score_resume(path, entry_jds, model)
+            except Exception as e:
+                print("Ingest error:", path, e)
+                stats.record(time.time() - entry["mtime"], ok=False)
+            else:
+                processed_at = time.time()
+
+                for result in results:
+                    record = {
+                        "file": path.name,
+                        "sha256": entry["sha256"],
+                        "processed_at": processed_at,
+                        **result,
+                    }
+
+                    if duplicate_of is not None:
+                        record["duplicate_of"] = duplicate_of
+
+                    out.write(json.dumps(record) + "\n")
+
+                out.flush()
+                os.fsync(out.fileno())
+
+                stats.record(processed_at - entry["mtime"])
+                processed += 1
+
+            # failed files are checkpointed too, so a bad file is not
+            # retried every poll; it is picked up again once it changes
+            scored_jds = {}
+
+            if entry["rescore"]:
+                scored_jds = {
+                    name: fp
+                    for name, fp in state[path.name].get("jds", {}).items()
+                    if jd_fingerprints.get(name) == fp
+                }
+
+            scored_jds.update({name: jd_fingerprints[name] for name in entry["jds"]})
+
+            state[path.name] = {
+                "mtime_ns": entry["mtime_ns"],
+                "size": entry["size"],
+                "sha256": entry["sha256"],
+                "jds": scored_jds,
+            }
+            append_state(state_log, path.name, state[path.name])
+
+    return processed
+
+
+def watch(
+    watch_dir: str,
+    jd_dir: str,
+    out_path: str,
+    state_path: Optional[str] = None,
+    interval: float = 5.0,
+    use_semantic: bool = False,
+    once: bool = False,
+    dedup_threshold: Optional[float] = None,
+) -> None:
+
+    state_path = state_path or str(Path(out_path).with_suffix(".state.jsonl"))
+
+    jds, jd_fingerprints = load_jds(jd_dir)
+    state = load_state(state_path)
+    stats = IngestStats()
+    dedup = DedupState(dedup_threshold) if dedup_threshold else None
+
+    model = None
+
+    if use_semantic:
+        from src.semantic import load_model
+
+        model = load_model()
+
+    print(
+        f"Watching {watch_dir} against {len(jds)} JD(s); "
+        f"{len(state)} file(s) already checkpointed"
+    )
+
+    while True:
+        # pick up JDs added or edited while running
+        try:
+            new_jds, new_fingerprints = load_jds(jd_dir)
+        except (OSError, ValueError) as e:
+            print("JD reload error, keeping previous set:", e)
+        else:
+            if new_fingerprints != jd_fingerprints:
+                print(f"JD set changed: {len(new_jds)} active JD(s)")
+
+                if dedup is not None:
+                    dedup.reset()
+
+            jds, jd_fingerprints = new_jds, new_fingerprints
+
+        processed = run_once(
+            watch_dir,
+            jds,
+            jd_fingerprints,
+            out_path,
+            state,
+            state_path,
+            stats,
+            model,
+            dedup,
+        )
+
+        if processed or once:
+            report = stats.report()
+
+            if dedup is not None:
+                report += f" duplicates={dedup.duplicates}"
+
+            print(report)
+
+        if once:
+            break
+
+        time.sleep(interval)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Watch-folder resume ingestion")
+    parser.add_argument("--watch", required=True, help="directory to watch")
+    parser.add_argument("--jd-dir", required=True, help="directory of JD .txt files")
+    parser.add_argument("--out", default="results.jsonl", help="JSONL results file")
+    parser.add_argument("--state", help="checkpoint log (default: <out>.state.jsonl)")
+    parser.add_argument("--interval", type=float, default=5.0, help="poll seconds")
+    parser.add_argument("--semantic", action="store_true", help="enable semantic scoring")
+    parser.add_argument("--once", action="store_true", help="single pass, then exit")
+    parser.add_argument(
+        "--dedup",
+        type=float,
+        nargs="?",
+        const=DEFAULT_THRESHOLD,
+        metavar="THRESHOLD",
+        help="reuse results for near-duplicate resumes (Jaccard threshold)",
+    )
+    args = parser.parse_args()
+
+    watch(
+        args.watch,
+        args.jd_dir,
+        args.out,
+        state_path=args.state,
+        interval=args.interval,
+        use_semantic=args.semantic,
+        once=args.once,
+        dedup_threshold=args.dedup,
+    )
+
+
+if __name__ == "__main__":
+    main()
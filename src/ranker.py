@@ -0,0 +1,165 @@
+# src/ranker.py
+"""
+Bulk ranking of many resumes against one JD.
+
+cascade_rank scores the whole pool structurally, then runs semantic
+matching only for candidates that can still reach the top-K.
+Its top-K is identical to exhaustive_rank, just cheaper.
+"""
+
+import heapq
+from typing import Dict, List
+
+from src.scorer import compute_structured_score, compute_hybrid_score
+from src.semantic import semantic_skill_match
+
+# semantic_skill_match returns a percentage of JD skills matched
+MAX_SEMANTIC_SCORE = 100.0
+
+
+def _result(candidate_id, structured_score, semantic_score, matched) -> dict:
+    return {
+        "id": candidate_id,
+        "structured_score": structured_score,
+        "semantic_score": semantic_score,
+        "final_score": compute_hybrid_score(structured_score, semantic_score),
+        "matched_skills": matched,
+    }
+
+
+def _semantic_result(model, candidate_id, resume_skills, jd_skills, structured) -> dict:
+    structured_score, matched_structured = structured
+
+    semantic_matched, semantic_score = semantic_skill_match(
+        model,
+        resume_skills,
+        jd_skills,
+    )
+
+    return _result(
+        candidate_id,
+        structured_score,
+        semantic_score,
+        sorted(set(matched_structured).union(semantic_matched)),
+    )
+
+
+def _sort_key(order: Dict[str, int]):
+    # score descending, then pool order, so ties break the same way
+    # in both rankers
+    return lambda r: (-r["final_score"], order[r["id"]])
+
+
+# ==============================
+# Exhaustive ranking (reference)
+# ==============================
+def exhaustive_rank(
+    model,
+    candidates: Dict[str, Dict[str, List[str]]],
+    jd_skills: Dict[str, List[str]],
+    top_k: int,
+) -> List[dict]:
+    """
+    Semantic scoring for every candidate. Used as the reference
+    that cascade_rank must reproduce.
+    """
+    order = {candidate_id: i for i, candidate_id in enumerate(candidates)}
+
+    results = [
+        _semantic_result(
+            model,
+            candidate_id,
+            resume_skills,
+            jd_skills,
+            compute_structured_score(resume_skills, jd_skills),
+        )
+        for candidate_id, resume_skills in candidates.items()
+    ]
+
+    return sorted(results, key=_sort_key(order))[:top_k]
+
+
+# ==============================
+# Cascade ranking
+# ==============================
+def score_upper_bound(structured_score: float, resume_skills, jd_skills) -> float:
+    """
+    Highest hybrid score reachable for this structured score.
+
+    semantic_skill_match returns 0 without encoding when either side
+    has no skills, so the bound is exact there.
+    compute_hybrid_score is monotone in semantic_score (rounding included),
+    so no semantic result can exceed this.
+    """
+    has_resume = any(resume_skills.values())
+    has_jd = any(jd_skills.values())
+
+    best_semantic = MAX_SEMANTIC_SCORE if has_resume and has_jd else 0.0
+
+    return compute_hybrid_score(structured_score, best_semantic)
+
+
+def cascade_rank(
+    model,
+    candidates: Dict[str, Dict[str, List[str]]],
+    jd_skills: Dict[str, List[str]],
+    top_k: int,
+):
+    """
+    Rank candidates by hybrid score, returning the same top-K as
+    exhaustive_rank plus evaluation counts.
+
+    Candidates are visited in descending upper-bound order. Once the
+    next bound is strictly below the K-th best exact score, no remaining
+    candidate can enter the top-K (ties included, since they would need
+    score >= K-th), so the rest are skipped.
+    """
+    order = {candidate_id: i for i, candidate_id in enumerate(candidates)}
+
+    # Stage 1: structured scores + bounds for the whole pool
+    stage_one = []
+
+    for candidate_id, resume_skills in candidates.items():
+        structured = compute_structured_score(resume_skills, jd_skills)
+        bound = score_upper_bound(structured[0], resume_skills, jd_skills)
+        stage_one.append((bound, candidate_id, resume_skills, structured))
+
+    stage_one.sort(key=lambda item: (-item[0], order[item[1]]))
+
+    # Stage 2: semantic scoring while the bound can still reach the top-K
+    evaluated = []
+    top_scores = []  # min-heap of the best K exact final scores
+    semantic_calls = 0
+
+    for bound, candidate_id, resume_skills, structured in stage_one:
+
+        if top_k <= 0:
+            break
+
+        if len(top_scores) == top_k and bound < top_scores[0]:
+            break
+
+        result = _semantic_result(
+            model,
+            candidate_id,
+            resume_skills,
+            jd_skills,
+            structured,
+        )
+        semantic_calls += 1
+        evaluated.append(result)
+
+        if len(top_scores) < top_k:
+            heapq.heappush(top_scores, result["final_score"])
+        elif result["final_score"] > top_scores[0]:
+            heapq.heapreplace(top_scores, result["final_score"])
+
+    ranking = sorted(evaluated, key=_sort_key(order))[:top_k]
+
+    stats = {
+        "pool_size": len(candidates),
+        "semantic_evaluated": semantic_calls,
+        "semantic_skipped": len(candidates) - semantic_calls,
+    }
+
+    return ranking, stats
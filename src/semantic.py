@@ -1,18 +1,180 @@
 # src/semantic.py
 
-from typing import Dict, List, Set, Tuple
+import argparse
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
 import torch
+import tokenizers
+import transformers
+import sentence_transformers
 from sentence_transformers import SentenceTransformer, util
 
+from src.matcher import SKILL_DB
+
+MODEL_NAME = "all-MiniLM-L6-v2"
 SIM_THRESHOLD = 0.65
 
+# ==============================
+# Local snapshot
+# ==============================
+# model.pt holds the prepared module graph, tokenizer state and weights
+# in one torch zip file, so tensors can be mmap'd straight from disk.
+# Resolved against the repo root so it does not depend on the cwd.
+# Prepare it at build/deploy time: python -m src.semantic --save-snapshot
+ROOT = Path(__file__).resolve().parent.parent
+SNAPSHOT_DIR = os.environ.get(
+    "RESUME_MODEL_SNAPSHOT",
+    str(ROOT / "models" / "minilm_snapshot"),
+)
+SNAPSHOT_FILE = "model.pt"
+SNAPSHOT_META = "meta.json"
+
+
+def _snapshot_meta() -> dict:
+    return {
+        "model_name": MODEL_NAME,
+        "torch": torch.__version__,
+        "sentence_transformers": sentence_transformers.__version__,
+        # the pickled module graph and tokenizer are their classes
+        "transformers": transformers.__version__,
+        "tokenizers": tokenizers.__version__,
+    }
+
+
+def _atomic_write(target: Path, write) -> None:
+    """
+    Write via a unique temp file in the same directory, then rename,
+    so concurrent first loads never interleave or expose partial files.
+    """
+    with tempfile.NamedTemporaryFile(
+        dir=target.parent,
+        prefix=target.name + ".",
+        suffix=".tmp",
+        delete=False,
+    ) as tmp:
+        tmp_path = Path(tmp.name)
+
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, target)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def save_snapshot(model, snapshot_dir: str = SNAPSHOT_DIR) -> Path:
+    """
+    Save a prepared model so later processes can skip the hub load.
+    """
+    path = Path(snapshot_dir)
+    path.mkdir(parents=True, exist_ok=True)
+
+    def write_meta(tmp_path):
+        with open(tmp_path, "w") as f:
+            json.dump(_snapshot_meta(), f, indent=2)
+
+    # model first: meta.json is what marks the snapshot as usable
+    _atomic_write(path / SNAPSHOT_FILE, lambda tmp_path: torch.save(model, tmp_path))
+    _atomic_write(path / SNAPSHOT_META, write_meta)
+
+    return path
+
+
+def load_snapshot(snapshot_dir: str = SNAPSHOT_DIR):
+    """
+    Load a snapshot written by save_snapshot.
+    Returns None if it is missing or was written by other library versions.
+    """
+    path = Path(snapshot_dir)
+    model_file = path / SNAPSHOT_FILE
+    meta_file = path / SNAPSHOT_META
+
+    if not model_file.exists() or not meta_file.exists():
+        return None
+
+    with open(meta_file) as f:
+        if json.load(f) != _snapshot_meta():
+            return None
+
+    # Pickled module graph: only load snapshots this app wrote itself
+    model = torch.load(
+        model_file,
+        map_location="cpu",
+        mmap=True,
+        weights_only=False,
+    )
+    model.eval()
+
+    return model
+
+
+# ==============================
+# Warm-up
+# ==============================
+def warm_up(model, batch_size: int = 32) -> None:
+    """
+    Encode representative SKILL_DB batches so lazy kernel and
+    tokenizer initialisation happens at load, not on the first request.
+    """
+    all_skills = [skill for skills in SKILL_DB.values() for skill in skills]
+
+    # single skill, one category, then the full set
+    batches = [all_skills[:1], next(iter(SKILL_DB.values())), all_skills]
+
+    with torch.inference_mode():
+        for batch in batches:
+            model.encode(
+                batch,
+                batch_size=batch_size,
+                convert_to_tensor=True,
+            )
+
+
+def _save_snapshot_quietly(model, snapshot_dir: str) -> None:
+    try:
+        save_snapshot(model, snapshot_dir)
+    except Exception as e:
+        print("Snapshot save error:", e)
 
-def load_model():
+
+def load_model(snapshot_dir: Optional[str] = SNAPSHOT_DIR, warm: bool = True):
     """
     Lazy load model.
     Called from Streamlit with caching.
+
+    Uses the local snapshot when available; otherwise loads from the
+    hub and writes the snapshot for the next process on a background
+    thread, off the cold-start path.
+    Pass snapshot_dir=None to always load from the hub.
     """
-    return SentenceTransformer("all-MiniLM-L6-v2")
+    model = None
+
+    if snapshot_dir:
+        try:
+            model = load_snapshot(snapshot_dir)
+        except Exception as e:
+            print("Snapshot load error:", e)
+
+    if model is None:
+        model = SentenceTransformer(MODEL_NAME)
+
+        if snapshot_dir:
+            # non-daemon, so a short-lived process still finishes the save
+            threading.Thread(
+                target=_save_snapshot_quietly,
+                args=(model, snapshot_dir),
+                name="snapshot-save",
+            ).start()
+
+    if warm:
+        warm_up(model)
+
+    return model
 
 
 def semantic_skill_match(
@@ -57,4 +219,31 @@ def semantic_skill_match(
 
     semantic_score = (len(matched) / len(jd_flat)) * 100
 
-    return matched, round(semantic_score, 2)
\ No newline at end of file
+    return matched, round(semantic_score, 2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Semantic model utilities")
+    parser.add_argument(
+        "--save-snapshot",
+        action="store_true",
+        help="load the model from the hub and write the local snapshot",
+    )
+    parser.add_argument("--snapshot-dir", default=SNAPSHOT_DIR)
+    args = parser.parse_args()
+
+    if not args.save_snapshot:
+        parser.print_help()
+        return
+
+    model = load_model(snapshot_dir=None, warm=False)
+    path = save_snapshot(model, args.snapshot_dir)
+
+    if load_snapshot(args.snapshot_dir) is None:
+        raise RuntimeError(f"Snapshot at {path} could not be reloaded")
+
+    print(f"Snapshot written to {path}")
+
+
+if __name__ == "__main__":
+    main()
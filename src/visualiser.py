@@ -1,9 +1,15 @@
 # src/visualiser.py
 
+import threading
+
 import numpy as np
 import matplotlib.pyplot as plt
 from sentence_transformers import util
 
+# pyplot keeps global figure state, so figures built from
+# background threads must not interleave with the main thread
+PYPLOT_LOCK = threading.Lock()
+
 
 def generate_similarity_matrix(model, resume_flat, jd_flat):
     """
@@ -39,12 +45,18 @@ def generate_similarity_matrix(model, resume_flat, jd_flat):
 
 def plot_heatmap(similarity_matrix, resume_flat, jd_flat):
     """
-    Dark-themed heatmap
+    Dark-themed heatmap.
+    Safe to call from a worker thread (holds PYPLOT_LOCK).
     """
 
     if similarity_matrix is None:
         return None
 
+    with PYPLOT_LOCK:
+        return _draw_heatmap(similarity_matrix, resume_flat, jd_flat)
+
+
+def _draw_heatmap(similarity_matrix, resume_flat, jd_flat):
     # Dark figure
     fig, ax = plt.subplots(figsize=(5.5, 4.5))
     fig.patch.set_facecolor("#0E1117")